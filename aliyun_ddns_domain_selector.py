@@ -2,30 +2,266 @@ import sys
 import json
 import re
 import os
+import time
+import ipaddress
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QLabel, QLineEdit, 
-                            QPushButton, QComboBox, QTextEdit, QGroupBox, 
-                            QMessageBox, QFrame, QTableWidget, QTableWidgetItem,
-                            QHeaderView, QHBoxLayout, QVBoxLayout, QDialog)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QEvent, QUrl
-from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QDesktopServices, QPixmap
+                            QPushButton, QComboBox, QPlainTextEdit, QGroupBox, 
+                            QMessageBox, QCheckBox, QAction, QFrame, QTableView, QStyledItemDelegate, QStyle,
+                            QHeaderView, QHBoxLayout, QVBoxLayout, QGridLayout, QDialog)
+from PyQt5.QtCore import (Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal,
+                          QEvent, QUrl, QRect, QAbstractTableModel, QModelIndex)
+from PyQt5.QtGui import (QFont, QIcon, QPalette, QColor, QDesktopServices, QPixmap,
+                         QBrush, QTextCharFormat, QTextCursor, QPainter, QCursor, QKeySequence)
 
-# 阿里云SDK相关导入
-from aliyunsdkcore.client import AcsClient
+# 阿里云SDK相关导入，客户端和请求模块较重，在首次调用时再导入以加快启动
 from aliyunsdkcore.acs_exception.exceptions import ClientException, ServerException
-from aliyunsdkalidns.request.v20150109 import (DescribeDomainsRequest, 
-                                              DescribeSubDomainRecordsRequest,
-                                              DescribeDomainRecordsRequest,
-                                              UpdateDomainRecordRequest,
-                                              AddDomainRecordRequest,
-                                              DeleteDomainRecordRequest,
-                                              SetDomainRecordStatusRequest)
 
 CURRENT_VERSION = "v2.0.0"
 RELEASES_URL = "https://api.github.com/repos/QsSama-W/aliddns/releases/latest"
 
 APP_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
 CONFIG_PATH = os.path.join(APP_DIR, 'AccessKey.json')
+UPDATE_CACHE_PATH = os.path.join(APP_DIR, '.update_cache.json')
+UPDATE_CACHE_TTL = 6 * 3600
+# 手动检查时复用内存中检查结果的有效期，以及后台检查失败后的首次重试间隔(秒)
+UPDATE_RESULT_TTL = 3600
+UPDATE_RETRY_BASE = 5 * 60
+# 域名列表与解析记录列表的缓存有效期(秒)
+RECORD_CACHE_TTL = 60
+# 日志框保留的最大行数
+LOG_MAX_LINES = 20
+
+# 复用连接的HTTP会话，重复检查更新时免去TCP/TLS握手
+_HTTP = requests.Session()
+_HTTP.headers.update({
+    'User-Agent': f'aliddns/{CURRENT_VERSION}',
+    'Accept': 'application/vnd.github+json'
+})
+_HTTP.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2,
+                                    max_retries=Retry(total=1, backoff_factor=0.3)))
+
+# 界面字体，模块加载时构建一次，各窗口共用
+_FONT_BASE = QFont("Microsoft YaHei", 9)
+_FONT_TITLE = QFont("Microsoft YaHei", 16, QFont.Bold)
+
+# 全局样式表，在QApplication上设置一次后按选择器匹配到各控件；
+# 规则均限定在主窗口(#central)、配置弹窗(#configDialog)和状态栏内，不影响系统消息框
+_APP_QSS = """
+    QWidget#central {
+        background-color: #F9FAFB;
+    }
+    QDialog#configDialog {
+        background-color: #F9FAFB;
+    }
+    QDialog#configDialog QLabel {
+        color: #374151;
+        font-weight: 500;
+    }
+    QStatusBar#mainStatus {
+        background-color: #F9FAFB;
+        color: #374151;
+        border-top: 1px solid #FECACA;
+        font-size: 8.5pt;
+        font-family: "Microsoft YaHei";
+    }
+    QWidget#central QLabel#title {
+        color: #EA580C;
+    }
+    QWidget#central QFrame#divider {
+        background-color: #FECACA;
+        margin-bottom: 10px;
+    }
+    QWidget#central QPushButton, QDialog#configDialog QPushButton {
+        background-color: #F97316;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-weight: 600;
+        font-family: "Microsoft YaHei";
+        font-size: 9pt;
+    }
+    QWidget#central QPushButton:hover, QDialog#configDialog QPushButton:hover {
+        background-color: #EA580C;
+    }
+    QWidget#central QPushButton:pressed, QDialog#configDialog QPushButton:pressed {
+        background-color: #C2410C;
+    }
+    QWidget#central QPushButton:disabled {
+        background-color: #FED7D7;
+        color: #9CA3AF;
+    }
+    QWidget#central QPushButton#primary {
+        background-color: #EA580C;
+        padding: 8px 16px;
+    }
+    QWidget#central QPushButton#primary:hover, QWidget#central QPushButton#primary:pressed {
+        background-color: #C2410C;
+    }
+    QWidget#central QPushButton#headerBtn {
+        background-color: #4F46E5;
+    }
+    QWidget#central QPushButton#headerBtn:hover {
+        background-color: #4338CA;
+    }
+    QWidget#central QGroupBox {
+        font-size: 11pt;
+        font-weight: bold;
+        color: #374151;
+        font-family: "Microsoft YaHei";
+        border: 1px solid #FECACA;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding: 20px 15px 15px 15px;
+        background-color: white;
+    }
+    QWidget#central QGroupBox#logGroup {
+        padding: 10px 15px 5px 15px;
+    }
+    QWidget#central QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 5px 0 5px;
+        color: #F97316;
+    }
+    QWidget#central QLabel#fieldLabel {
+        color: #374151;
+        font-weight: 500;
+        font-size: 9pt;
+        font-family: "Microsoft YaHei";
+    }
+    QWidget#central QLabel#ipVersion {
+        font-size: 8pt;
+        font-family: "Microsoft YaHei";
+    }
+    QWidget#central QComboBox, QWidget#central QLineEdit, QDialog#configDialog QLineEdit {
+        border: 1px solid #FECACA;
+        border-radius: 4px;
+        padding: 5px 10px;
+        font-size: 9pt;
+        font-family: "Microsoft YaHei";
+        background-color: #FAFAFA;
+    }
+    QWidget#central QComboBox:focus, QWidget#central QLineEdit:focus, QDialog#configDialog QLineEdit:focus {
+        border-color: #F97316;
+        background-color: white;
+    }
+    QWidget#central QTableView {
+        border: 1px solid #FECACA;
+        border-radius: 4px;
+        background-color: #FAFAFA;
+        font-family: "Microsoft YaHei";
+        font-size: 8.5pt;
+    }
+    QWidget#central QHeaderView::section {
+        background-color: #FEE2E2;
+        color: #374151;
+        padding: 5px;
+        border: 1px solid #FECACA;
+        font-weight: bold;
+        font-size: 8.5pt;
+    }
+    QWidget#central QTableView::item {
+        padding: 5px;
+        border-bottom: 1px solid #FEE2E2;
+    }
+    QWidget#central QTableView::item:selected {
+        background-color: #FFEDD5;
+        color: #C2410C;
+    }
+    QWidget#central QPlainTextEdit#log {
+        border: 1px solid #FECACA;
+        border-radius: 4px;
+        background-color: #FAFAFA;
+        font-family: "Microsoft YaHei", Consolas, 'Courier New', monospace;
+        font-size: 8.5pt;
+        padding: 3px;
+    }
+    QWidget#central QPlainTextEdit#log QScrollBar:vertical {
+        border: none;
+        background: transparent;
+        width: 6px;
+        margin: 0px;
+    }
+    QWidget#central QPlainTextEdit#log QScrollBar::handle:vertical {
+        background: rgba(249, 115, 22, 0.5);
+        min-height: 20px;
+        border-radius: 3px;
+    }
+    QWidget#central QPlainTextEdit#log QScrollBar::add-line:vertical, QWidget#central QPlainTextEdit#log QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+# 预编译正则，避免每次检查都重新查找/编译
+_VERSION_RE = re.compile(r'v(\d+)\.(\d+)\.(\d+)', re.ASCII)
+# IP版本 -> 解析记录类型
+_RECORD_TYPE_BY_VERSION = {4: "A", 6: "AAAA"}
+# 记录列表中展示和管理的记录类型
+_RECORD_TYPES = frozenset(_RECORD_TYPE_BY_VERSION.values())
+
+
+def _parse_version(version):
+    """解析vX.Y.Z格式的版本号为整数元组，格式无效返回None"""
+    match = _VERSION_RE.fullmatch(version)
+    return tuple(map(int, match.groups())) if match else None
+
+
+_CURRENT_VERSION_TUPLE = _parse_version(CURRENT_VERSION)
+
+
+def _read_json(path):
+    """以二进制读取JSON文件，由json自行识别编码(兼容记事本保存的带BOM的UTF-8)"""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def _write_json_atomic(path, data):
+    """先写临时文件再替换，避免写入中途异常导致文件损坏"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+    os.replace(tmp_path, path)
+
+
+_APP_ICON = None
+
+
+def _app_icon():
+    """应用图标，首次使用时解码一次(需在QApplication创建之后调用)"""
+    global _APP_ICON
+    if _APP_ICON is None:
+        logo_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images", "logo.png")
+        _APP_ICON = QIcon(QPixmap(logo_path)) if os.path.isfile(logo_path) else QIcon()
+    return _APP_ICON
+
+
+def _full_domain(rr, main_domain):
+    """主机记录拼接为完整域名，'@'即主域名本身"""
+    return main_domain if rr == '@' else f"{rr}.{main_domain}"
+
+
+def _classify_ip(ip):
+    """返回IP版本(4/6)，无效地址返回None"""
+    # IP文本最长45个字符，超长输入(如误粘贴的大段文本)直接判为无效
+    if len(ip) > 45:
+        return None
+    # 含冒号的只可能是IPv6，直接选对应解析器，免去先按IPv4解析失败的开销
+    address_class = ipaddress.IPv6Address if ':' in ip else ipaddress.IPv4Address
+    try:
+        addr = address_class(ip)
+    except ValueError:
+        return None
+    # 带区域ID(如 fe80::1%eth0)的地址不能作为解析记录值
+    if getattr(addr, 'scope_id', None):
+        return None
+    return addr.version
 
 
 class DomainUpdateEvent(QEvent):
@@ -36,188 +272,353 @@ class DomainUpdateEvent(QEvent):
         self.domains = domains
 
 
-class UpdateCheckThread(QThread):
+class UpdateCheckSignals(QObject):
     update_available = pyqtSignal(str)
     no_update = pyqtSignal()
     check_failed = pyqtSignal(str)
+
+
+class UpdateCheckWorker(QRunnable):
+    def __init__(self, use_cache=True):
+        super().__init__()
+        self.signals = UpdateCheckSignals()
+        self.use_cache = use_cache
     
     def run(self):
+        cache = self.read_cache()
+        cached_version = cache.get('tag_name', '')
+        if self.use_cache and time.time() - cache.get('timestamp', 0) < UPDATE_CACHE_TTL:
+            self.emit_result(cached_version)
+            return
+        
         try:
-            response = requests.get(RELEASES_URL, timeout=10)
+            # 带上次的ETag做条件请求，版本未变时GitHub返回无正文的304
+            headers = {'If-None-Match': cache['etag']} if cache.get('etag') else None
+            response = _HTTP.get(RELEASES_URL, headers=headers, timeout=(3, 7))
+            if response.status_code == 304 and cached_version:
+                if self.emit_result(cached_version):
+                    self.write_cache(cached_version, cache['etag'])
+                return
             if response.status_code != 200:
-                self.check_failed.emit(f"请求失败，状态码: {response.status_code}")
+                self.signals.check_failed.emit(f"请求失败，状态码: {response.status_code}")
                 return
                 
-            release_info = response.json()
+            # 直接解析原始字节，json可自行识别UTF编码，省去requests的文本解码
+            release_info = json.loads(response.content)
             latest_version = release_info.get('tag_name', '')
-            
-            if not re.match(r'^v\d+\.\d+\.\d+$', latest_version):
-                self.check_failed.emit(f"获取的版本格式无效: {latest_version}")
-                return
-                
-            if self.is_new_version(latest_version, CURRENT_VERSION):
-                self.update_available.emit(latest_version)
-            else:
-                self.no_update.emit()
+            if self.emit_result(latest_version):
+                self.write_cache(latest_version, response.headers.get('ETag'))
                 
         except requests.exceptions.Timeout:
-            self.check_failed.emit("连接超时，请检查网络")
+            self.signals.check_failed.emit("连接超时，请检查网络")
         except requests.exceptions.RequestException as e:
-            self.check_failed.emit(f"网络请求错误: {str(e)}")
+            self.signals.check_failed.emit(f"网络请求错误: {str(e)}")
         except Exception as e:
-            self.check_failed.emit(f"检查更新失败: {str(e)}")
-    
-    def is_new_version(self, latest, current):
-        latest_numbers = list(map(int, latest[1:].split('.')))
-        current_numbers = list(map(int, current[1:].split('.')))
-        
-        for l, c in zip(latest_numbers, current_numbers):
-            if l > c:
-                return True
-            elif l < c:
-                return False
-        return False
+            self.signals.check_failed.emit(f"检查更新失败: {str(e)}")
+    
+    def emit_result(self, latest_version):
+        """校验版本号并发出对应信号，版本号格式无效时返回False"""
+        latest = _parse_version(latest_version)
+        if latest is None:
+            self.signals.check_failed.emit(f"获取的版本格式无效: {latest_version}")
+            return False
+        if latest > _CURRENT_VERSION_TUPLE:
+            self.signals.update_available.emit(latest_version)
+        else:
+            self.signals.no_update.emit()
+        return True
+    
+    def read_cache(self):
+        """读取版本缓存(含过期的，其ETag仍可用于条件请求)，无缓存或版本号无效返回空字典"""
+        try:
+            cache = _read_json(UPDATE_CACHE_PATH)
+            if _parse_version(cache.get('tag_name', '')):
+                return cache
+        except Exception:
+            pass
+        return {}
+    
+    def write_cache(self, latest_version, etag=None):
+        try:
+            _write_json_atomic(UPDATE_CACHE_PATH, {'timestamp': time.time(), 'tag_name': latest_version,
+                                                   'etag': etag})
+        except Exception:
+            pass
 
 
-class WorkerThread(QThread):
+class WorkerSignals(QObject):
     signal = pyqtSignal(str, bool)
     domain_signal = pyqtSignal(list)
     records_signal = pyqtSignal(list)
-    
+
+
+class Worker(QRunnable):
+    """在线程池中执行func，func的第一个参数为WorkerSignals，用于回传中间数据"""
     def __init__(self, func, *args, **kwargs):
         super().__init__()
+        self.signals = WorkerSignals()
         self.func = func
         self.args = args
         self.kwargs = kwargs
         
     def run(self):
         try:
-            result = self.func(*self.args, **self.kwargs)
-            self.signal.emit(result, True)
+            result = self.func(self.signals, *self.args, **self.kwargs)
+            self.signals.signal.emit(result, True)
         except Exception as e:
-            self.signal.emit(f"操作失败: {str(e)}", False)
+            self.signals.signal.emit(f"操作失败: {str(e)}", False)
 
 
 class AliyunDNSClient:
     def __init__(self, access_key_id, access_key_secret, region_id="cn-hangzhou"):
-        self.client = self._init_client(access_key_id, access_key_secret, region_id)
-        
+        # SDK的导入和客户端创建推迟到首次请求时，在后台线程中进行，不拖慢窗口显示
+        self._credentials = (access_key_id, access_key_secret, region_id)
+        self._client = None
+        self._client_lock = threading.Lock()
+        # 'domains' 或 ('records', 主域名) -> (数据, 写入时间)，批量设置时会被多个线程访问
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        # 窗口关闭时置位，每个请求发出前检查
+        self._cancelled = threading.Event()
+        
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._init_client(*self._credentials)
+        return self._client
+    
     def _init_client(self, access_key_id, access_key_secret, region_id):
+        from aliyunsdkcore.client import AcsClient
         try:
-            return AcsClient(ak=access_key_id, secret=access_key_secret, region_id=region_id)
+            # 显式限定超时和重试次数，关闭窗口时进行中的请求最多阻塞十余秒
+            return AcsClient(ak=access_key_id, secret=access_key_secret, region_id=region_id,
+                             connect_timeout=3, timeout=8, max_retry_time=1)
         except TypeError:
             return AcsClient(access_key_id=access_key_id, access_key_secret=access_key_secret, region_id=region_id)
     
-    def get_domains(self):
-        try:
-            request = DescribeDomainsRequest.DescribeDomainsRequest()
-            request.set_accept_format('json')
-            request.set_PageSize(100)
-            
-            response = self.client.do_action_with_exception(request)
-            response_data = json.loads(response)
-            
-            if response_data.get('TotalCount', 0) > 0:
-                return [domain['DomainName'] for domain in response_data['Domains']['Domain']]
-            return []
-        except (ClientException, ServerException) as e:
-            raise Exception(f"获取域名列表失败: {str(e)}")
+    def cancel(self):
+        """取消后续请求，正在进行的请求由超时设置兜底"""
+        self._cancelled.set()
+    
+    def _check_cancelled(self):
+        if self._cancelled.is_set():
+            raise Exception("操作已取消")
+    
+    def _cache_get(self, key):
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry and time.time() - entry[1] < RECORD_CACHE_TTL:
+            return entry[0]
+        return None
+    
+    def _cache_put(self, key, value):
+        with self._cache_lock:
+            self._cache[key] = (value, time.time())
     
-    def get_record_id(self, main_domain, sub_domain, record_type="A"):
+    def invalidate(self, domain=None):
+        """清除缓存，不指定域名时清除全部(含域名列表)"""
+        with self._cache_lock:
+            if domain is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(('records', domain), None)
+    
+    def _patch_cached_record(self, record_id, fields=None):
+        """写操作成功后按记录ID修正缓存，fields为None时移除该记录
+        
+        缓存列表可能正被其他线程或界面持有，因此替换为新列表而不原地修改，写入时间保持不变
+        """
+        with self._cache_lock:
+            for key, (value, timestamp) in list(self._cache.items()):
+                if key == 'domains' or not any(record['record_id'] == record_id for record in value):
+                    continue
+                patched = []
+                for record in value:
+                    if record['record_id'] != record_id:
+                        patched.append(record)
+                    elif fields is not None:
+                        patched.append({**record, **fields})
+                self._cache[key] = (patched, timestamp)
+    
+    def _append_cached_record(self, main_domain, record):
+        """新增记录后追加到该域名的缓存(若已缓存)"""
+        with self._cache_lock:
+            entry = self._cache.get(('records', main_domain))
+            if entry:
+                self._cache[('records', main_domain)] = (entry[0] + [record], entry[1])
+    
+    def _call(self, request, err_msg):
+        """发送请求并解析JSON响应，SDK异常统一转换为带操作说明的异常"""
+        self._check_cancelled()
+        request.set_accept_format('json')
         try:
-            full_sub_domain = f"{sub_domain}.{main_domain}" if sub_domain != '@' else main_domain
-            request = DescribeSubDomainRecordsRequest.DescribeSubDomainRecordsRequest()
-            request.set_accept_format('json')
-            request.set_SubDomain(full_sub_domain)
-            request.set_Type(record_type)
-            
-            response = self.client.do_action_with_exception(request)
-            response_data = json.loads(response)
-            
-            if response_data['TotalCount'] > 0:
-                return response_data['DomainRecords']['Record'][0]['RecordId']
-            return None
+            return json.loads(self.client.do_action_with_exception(request))
         except (ClientException, ServerException) as e:
-            raise Exception(f"查询解析记录失败: {str(e)}")
+            raise Exception(f"{err_msg}: {str(e)}")
     
-    def get_domain_records(self, main_domain):
-        try:
+    def _fetch_all_pages(self, build_request, page_size, err_msg):
+        """按页拉取列表，首页确定总数后并发获取剩余页"""
+        def fetch(page_number):
+            request = build_request()
+            request.set_PageSize(page_size)
+            request.set_PageNumber(page_number)
+            return self._call(request, err_msg)
+        
+        first_page = fetch(1)
+        page_count = -(-first_page.get('TotalCount', 0) // page_size)
+        if page_count <= 1:
+            return [first_page]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return [first_page] + list(executor.map(fetch, range(2, page_count + 1)))
+    
+    def get_domains(self):
+        cached = self._cache_get('domains')
+        if cached is not None:
+            return cached
+        
+        from aliyunsdkalidns.request.v20150109 import DescribeDomainsRequest
+        pages = self._fetch_all_pages(DescribeDomainsRequest.DescribeDomainsRequest, 100, "获取域名列表失败")
+        domains = [domain['DomainName'] for page in pages
+                   for domain in page.get('Domains', {}).get('Domain', [])]
+        self._cache_put('domains', domains)
+        return domains
+    
+    def apply_updates(self, main_domain, changes):
+        """批量设置解析记录，changes为[(主机记录, 记录值, 类型)]
+        
+        与一次拉取的记录列表比对，只对有变化的记录并发调用接口。
+        返回与changes一一对应的[(动作, 异常)]，动作为 unchanged/updated/added
+        """
+        def index(records):
+            return {(record['rr'], record['type']): (record['record_id'], record['value'])
+                    for record in records}
+        
+        existing_records = index(self.get_domain_records(main_domain))
+        if any(existing_records.get((sub_domain, record_type), (None, None))[1] == value
+               for sub_domain, value, record_type in changes):
+            # 缓存可能已过时，报告"无需更新"前绕过缓存重新拉取一次记录确认
+            existing_records = index(self.get_domain_records(main_domain, use_cache=False))
+        
+        def apply(change):
+            sub_domain, value, record_type = change
+            existing = existing_records.get((sub_domain, record_type))
+            try:
+                if existing and existing[1] == value:
+                    return 'unchanged', None
+                if existing:
+                    self.update_record(existing[0], main_domain, sub_domain, value, record_type)
+                    return 'updated', None
+                self.add_record(main_domain, sub_domain, value, record_type)
+                return 'added', None
+            except Exception as e:
+                # 失败可能源于过时的记录ID或重复记录，清除缓存以免下次仍依据旧数据判断
+                self.invalidate(main_domain)
+                return None, e
+        
+        if len(changes) == 1:
+            return [apply(changes[0])]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(apply, changes))
+    
+    def get_domain_records(self, main_domain, use_cache=True):
+        cached = self._cache_get(('records', main_domain)) if use_cache else None
+        if cached is not None:
+            return cached
+        
+        from aliyunsdkalidns.request.v20150109 import DescribeDomainRecordsRequest
+        def build_request():
             request = DescribeDomainRecordsRequest.DescribeDomainRecordsRequest()
-            request.set_accept_format('json')
             request.set_DomainName(main_domain)
-            request.set_PageSize(100)
-            
-            response = self.client.do_action_with_exception(request)
-            response_data = json.loads(response)
-            
-            records = []
-            if response_data.get('TotalCount', 0) > 0:
-                for record in response_data['DomainRecords']['Record']:
-                    if record['Type'] in ['A', 'AAAA']:
-                        rr = record['RR']
-                        full_domain = f"{rr}.{main_domain}" if rr != '@' else main_domain
-                        records.append({
-                            'full_domain': full_domain,
-                            'rr': rr,
-                            'type': record['Type'],
-                            'value': record['Value'],
-                            'record_id': record['RecordId'],
-                            'status': record['Status']
-                        })
-            return records
-        except (ClientException, ServerException) as e:
-            raise Exception(f"获取解析记录失败: {str(e)}")
+            return request
+        
+        records = [{
+            'full_domain': _full_domain(rr, main_domain),
+            'rr': rr,
+            'type': record_type,
+            'value': record['Value'],
+            'record_id': record['RecordId'],
+            'status': record['Status']
+        } for page in self._fetch_all_pages(build_request, 500, "获取解析记录失败")
+          for record in page.get('DomainRecords', {}).get('Record', ())
+          for record_type, rr in ((record['Type'], record['RR']),)
+          if record_type in _RECORD_TYPES]
+        self._cache_put(('records', main_domain), records)
+        return records
     
     def update_record(self, record_id, main_domain, sub_domain, ip_address, record_type="A"):
-        try:
-            request = UpdateDomainRecordRequest.UpdateDomainRecordRequest()
-            request.set_accept_format('json')
-            request.set_RecordId(record_id)
-            request.set_RR(sub_domain)
-            request.set_Type(record_type)
-            request.set_Value(ip_address)
-            
-            response = self.client.do_action_with_exception(request)
-            return json.loads(response)
-        except (ClientException, ServerException) as e:
-            raise Exception(f"更新解析记录失败: {str(e)}")
+        from aliyunsdkalidns.request.v20150109 import UpdateDomainRecordRequest
+        request = UpdateDomainRecordRequest.UpdateDomainRecordRequest()
+        request.set_RecordId(record_id)
+        request.set_RR(sub_domain)
+        request.set_Type(record_type)
+        request.set_Value(ip_address)
+        
+        response = self._call(request, "更新解析记录失败")
+        # 就地修正缓存，重复设置同一主机记录时无需重新拉取整个域名
+        self._patch_cached_record(record_id, {
+            'full_domain': _full_domain(sub_domain, main_domain),
+            'rr': sub_domain,
+            'type': record_type,
+            'value': ip_address
+        })
+        return response
     
     def add_record(self, main_domain, sub_domain, ip_address, record_type="A"):
-        try:
-            request = AddDomainRecordRequest.AddDomainRecordRequest()
-            request.set_accept_format('json')
-            request.set_DomainName(main_domain)
-            request.set_RR(sub_domain)
-            request.set_Type(record_type)
-            request.set_Value(ip_address)
-            
-            response = self.client.do_action_with_exception(request)
-            return json.loads(response)
-        except (ClientException, ServerException) as e:
-            raise Exception(f"添加解析记录失败: {str(e)}")
+        from aliyunsdkalidns.request.v20150109 import AddDomainRecordRequest
+        request = AddDomainRecordRequest.AddDomainRecordRequest()
+        request.set_DomainName(main_domain)
+        request.set_RR(sub_domain)
+        request.set_Type(record_type)
+        request.set_Value(ip_address)
+        
+        response = self._call(request, "添加解析记录失败")
+        if 'RecordId' in response:
+            self._append_cached_record(main_domain, {
+                'full_domain': _full_domain(sub_domain, main_domain),
+                'rr': sub_domain,
+                'type': record_type,
+                'value': ip_address,
+                'record_id': response['RecordId'],
+                'status': 'ENABLE'
+            })
+        else:
+            self.invalidate(main_domain)
+        return response
     
     def set_record_status(self, record_id, status):
-        try:
-            request = SetDomainRecordStatusRequest.SetDomainRecordStatusRequest()
-            request.set_accept_format('json')
-            request.set_RecordId(record_id)
-            request.set_Status(status)
-            
-            response = self.client.do_action_with_exception(request)
-            return json.loads(response)
-        except (ClientException, ServerException) as e:
-            raise Exception(f"设置解析状态失败: {str(e)}")
+        from aliyunsdkalidns.request.v20150109 import SetDomainRecordStatusRequest
+        request = SetDomainRecordStatusRequest.SetDomainRecordStatusRequest()
+        request.set_RecordId(record_id)
+        request.set_Status(status)
+        
+        response = self._call(request, "设置解析状态失败")
+        self._patch_cached_record(record_id, {'status': status.upper()})
+        return response
     
     def delete_record(self, record_id):
-        try:
-            request = DeleteDomainRecordRequest.DeleteDomainRecordRequest()
-            request.set_accept_format('json')
-            request.set_RecordId(record_id)
-            
-            response = self.client.do_action_with_exception(request)
-            return json.loads(response)
-        except (ClientException, ServerException) as e:
-            raise Exception(f"删除解析记录失败: {str(e)}")
+        from aliyunsdkalidns.request.v20150109 import DeleteDomainRecordRequest
+        request = DeleteDomainRecordRequest.DeleteDomainRecordRequest()
+        request.set_RecordId(record_id)
+        
+        response = self._call(request, "删除解析记录失败")
+        self._patch_cached_record(record_id)
+        return response
+    
+    def delete_records(self, record_ids):
+        """并发删除多条记录，返回与record_ids一一对应的异常(成功为None)"""
+        def delete(record_id):
+            try:
+                self.delete_record(record_id)
+                return None
+            except Exception as e:
+                return e
+        
+        if len(record_ids) == 1:
+            return [delete(record_ids[0])]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(delete, record_ids))
 
 
 class ConfigDialog(QDialog):
@@ -227,35 +628,15 @@ class ConfigDialog(QDialog):
         self.parent = parent
         self.setWindowTitle("账号配置")
         self.setFixedSize(400, 280)
+        self._loaded_config = None
         self.init_ui()
         self.load_config()
         
         # 设置字体
-        font = QFont("Microsoft YaHei", 9)
-        self.setFont(font)
+        self.setFont(_FONT_BASE)
         
-        # 设置样式
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #F9FAFB;
-            }
-            QLabel {
-                color: #374151;
-                font-weight: 500;
-            }
-            QLineEdit {
-                border: 1px solid #FECACA;
-                border-radius: 4px;
-                padding: 5px 10px;
-                font-size: 9pt;
-                font-family: "Microsoft YaHei";
-                background-color: #FAFAFA;
-            }
-            QLineEdit:focus {
-                border-color: #F97316;
-                background-color: white;
-            }
-        """)
+        # 样式由全局样式表按对象名匹配
+        self.setObjectName("configDialog")
     
     def init_ui(self):
         main_layout = QVBoxLayout(self)
@@ -304,30 +685,6 @@ class ConfigDialog(QDialog):
         self.save_config_btn = QPushButton("保存配置")
         self.save_config_btn.setFixedSize(100, 35)
         
-        # 按钮样式
-        button_style = """
-            QPushButton {
-                background-color: #F97316;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: 600;
-                font-family: "Microsoft YaHei";
-                font-size: 9pt;
-            }
-            QPushButton:hover {
-                background-color: #EA580C;
-            }
-            QPushButton:pressed {
-                background-color: #C2410C;
-            }
-        """
-        
-        self.test_conn_btn.setStyleSheet(button_style)
-        self.load_config_btn.setStyleSheet(button_style)
-        self.save_config_btn.setStyleSheet(button_style)
-        
         btn_layout.addWidget(self.test_conn_btn)
         btn_layout.addWidget(self.load_config_btn)
         btn_layout.addWidget(self.save_config_btn)
@@ -353,14 +710,14 @@ class ConfigDialog(QDialog):
     
     def load_config(self):
         try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                self.access_key_id_edit.setText(config.get('access_key_id', ''))
-                self.access_key_secret_edit.setText(config.get('access_key_secret', ''))
-                self.region_edit.setText(config.get('region_id', 'cn-hangzhou'))
-                
-                if self.parent:
-                    self.parent.log(f"配置文件加载成功: {CONFIG_PATH}")
+            config = _read_json(CONFIG_PATH)
+            self._loaded_config = config
+            self.access_key_id_edit.setText(config.get('access_key_id', ''))
+            self.access_key_secret_edit.setText(config.get('access_key_secret', ''))
+            self.region_edit.setText(config.get('region_id', 'cn-hangzhou'))
+            
+            if self.parent:
+                self.parent.log(f"配置文件加载成功: {CONFIG_PATH}")
         except FileNotFoundError:
             if self.parent:
                 self.parent.log(f"未找到配置文件: {CONFIG_PATH}", False)
@@ -370,14 +727,20 @@ class ConfigDialog(QDialog):
     
     def save_config(self):
         try:
+            access_key_id, access_key_secret, region_id = self._creds()
             config = {
-                'access_key_id': self.access_key_id_edit.text().strip(),
-                'access_key_secret': self.access_key_secret_edit.text().strip(),
-                'region_id': self.region_edit.text().strip() or 'cn-hangzhou'
+                'access_key_id': access_key_id,
+                'access_key_secret': access_key_secret,
+                'region_id': region_id
             }
             
-            with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            if config == self._loaded_config:
+                if self.parent:
+                    self.parent.log("配置未变化，跳过写入")
+                return
+            
+            _write_json_atomic(CONFIG_PATH, config)
+            self._loaded_config = config
             
             if self.parent:
                 self.parent.log(f"配置已保存到: {CONFIG_PATH}")
@@ -389,10 +752,14 @@ class ConfigDialog(QDialog):
                 self.parent.log(f"保存配置失败: {str(e)}", False)
             QMessageBox.warning(self, "保存失败", f"保存配置失败: {str(e)}")
     
+    def _creds(self):
+        """读取输入框中的凭据，返回 (access_key_id, access_key_secret, region_id)"""
+        return (self.access_key_id_edit.text().strip(),
+                self.access_key_secret_edit.text().strip(),
+                self.region_edit.text().strip() or 'cn-hangzhou')
+    
     def test_connection(self):
-        access_key_id = self.access_key_id_edit.text().strip()
-        access_key_secret = self.access_key_secret_edit.text().strip()
-        region_id = self.region_edit.text().strip() or 'cn-hangzhou'
+        access_key_id, access_key_secret, region_id = self._creds()
         
         if not access_key_id or not access_key_secret:
             QMessageBox.warning(self, "输入错误", "请填写AccessKey ID和AccessKey Secret")
@@ -402,14 +769,16 @@ class ConfigDialog(QDialog):
             self.parent.log("正在测试连接...")
             self.parent.statusBar().showMessage("正在测试连接...")
         
-        def test_func():
-            client = AliyunDNSClient(access_key_id, access_key_secret, region_id)
+        # 使用表单中尚未保存的凭据单独建立客户端，不替换主窗口的客户端及其缓存
+        client = AliyunDNSClient(access_key_id, access_key_secret, region_id)
+        
+        def test_func(signals):
             domains = client.get_domains()
             return f"连接成功，共找到 {len(domains)} 个域名"
         
-        self.worker_thread = WorkerThread(test_func)
-        self.worker_thread.signal.connect(self.on_test_finished)
-        self.worker_thread.start()
+        worker = Worker(test_func)
+        worker.signals.signal.connect(self.on_test_finished)
+        QThreadPool.globalInstance().start(worker)
     
     def on_test_finished(self, message, success):
         if self.parent:
@@ -422,27 +791,197 @@ class ConfigDialog(QDialog):
             QMessageBox.warning(self, "测试失败", message)
 
 
+class RecordsModel(QAbstractTableModel):
+    """解析记录表格模型，直接使用get_domain_records返回的记录列表"""
+    HEADERS = ["完整域名", "记录类型", "IP地址", "状态", "操作"]
+    # 文字颜色在每次绘制单元格时都会取用，预先构建后共用
+    GREEN = QBrush(QColor(16, 185, 129))
+    BLUE = QBrush(QColor(59, 130, 246))
+    RED = QBrush(QColor(239, 68, 68))
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.records = []
+    
+    def set_records(self, records):
+        self.beginResetModel()
+        self.records = records
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.records[index.row()]
+        column = index.column()
+        
+        if role == Qt.UserRole:
+            return record
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return record['full_domain']
+            if column == 1:
+                return record['type']
+            if column == 2:
+                return record['value']
+            if column == 3:
+                return "启用" if record['status'] == 'ENABLE' else "暂停"
+        elif role == Qt.ForegroundRole:
+            if column == 1:
+                return self.GREEN if record['type'] == 'A' else self.BLUE
+            if column == 3:
+                return self.GREEN if record['status'] == 'ENABLE' else self.RED
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class ActionDelegate(QStyledItemDelegate):
+    """操作列按钮，直接绘制而不为每行创建控件，点击时发出对应记录"""
+    toggle_requested = pyqtSignal(object)
+    delete_requested = pyqtSignal(object)
+    
+    BUTTON_WIDTH = 60
+    BUTTON_HEIGHT = 20
+    BUTTON_GAP = 30
+    # 按钮类型 -> (文字, 底色, 悬停色)
+    BUTTONS = {
+        'pause': ("暂停", QColor("#F59E0B"), QColor("#D97706")),
+        'enable': ("启用", QColor("#10B981"), QColor("#059669")),
+        'delete': ("删除", QColor("#EF4444"), QColor("#DC2626"))
+    }
+    
+    def __init__(self, view):
+        super().__init__(view)
+        self._view = view
+        self._font = QFont(_FONT_BASE)
+        self._font.setPointSize(8)
+        self._font.setWeight(QFont.DemiBold)
+        # 鼠标在单元格内移动时也要收到事件，以便刷新悬停颜色
+        view.viewport().setMouseTracking(True)
+        view.viewport().setAttribute(Qt.WA_Hover)
+    
+    def _button_rects(self, rect):
+        """单元格内居中排列的(切换状态, 删除)两个按钮区域"""
+        width, height, gap = self.BUTTON_WIDTH, self.BUTTON_HEIGHT, self.BUTTON_GAP
+        left = rect.x() + (rect.width() - 2 * width - gap) // 2
+        top = rect.y() + (rect.height() - height) // 2
+        return QRect(left, top, width, height), QRect(left + width + gap, top, width, height)
+    
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        record = index.data(Qt.UserRole)
+        kinds = ('pause' if record['status'] == 'ENABLE' else 'enable', 'delete')
+        cursor_pos = None
+        if option.state & QStyle.State_MouseOver:
+            cursor_pos = self._view.viewport().mapFromGlobal(QCursor.pos())
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(self._font)
+        for rect, kind in zip(self._button_rects(option.rect), kinds):
+            text, color, hover_color = self.BUTTONS[kind]
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(hover_color if cursor_pos is not None and rect.contains(cursor_pos) else color)
+            painter.drawRoundedRect(rect, 3, 3)
+            painter.setPen(Qt.white)
+            painter.drawText(rect, Qt.AlignCenter, text)
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.MouseMove, QEvent.MouseButtonPress,
+                                QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            return super().editorEvent(event, model, option, index)
+        if event.type() == QEvent.MouseMove:
+            self._view.viewport().update(option.rect)
+        
+        rects = self._button_rects(option.rect)
+        hit = next((i for i, rect in enumerate(rects) if rect.contains(event.pos())), None)
+        if hit is None:
+            return False
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            record = index.data(Qt.UserRole)
+            (self.toggle_requested if hit == 0 else self.delete_requested).emit(record)
+        return True
+
+
 class DNSManagerUI(QMainWindow):
+    # 配置文件确认存在后，本进程内不再重复检查
+    _config_ensured = False
+    _RELEASES_PAGE = QUrl("https://github.com/QsSama-W/aliddns/releases")
+    
     def __init__(self):
         super().__init__()
         self.dns_client = None
-        self.worker_thread = None
-        self.update_thread = None
+        self._client_key = None
+        self._last_domains = None
+        # 配置文件的(修改时间, 大小)及解析出的凭据，文件未变化时不再重复读取
+        self._config_stamp = None
+        self._config_creds = None
+        # 窗口隐藏或最小化期间的日志先暂存，重新显示时一次写入，上限与日志框一致
+        self._pending_logs = deque(maxlen=LOG_MAX_LINES)
+        # 删除确认框中勾选"本次会话不再提示"后置位
+        self._skip_delete_confirm = False
+        # DNS操作串行执行，保证结果按操作顺序返回
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        # 域名列表/记录列表查询的代号，只有最后发起的查询(及其后的写操作)能更新界面，排队中的过期查询直接跳过
+        self._domains_gen = 0
+        self._records_gen = 0
         self.ensure_config_exists()
+        QApplication.instance().setStyleSheet(_APP_QSS)
         self.init_ui()
-        self.check_for_updates(show_no_update_msg=False)
-    
-    def safe_terminate_thread(self, thread):
-        if thread and thread.isRunning():
-            thread.terminate()
-            thread.wait()
         
+        # 域名列表在窗口显示前即开始后台加载；配置不完整的提示框推迟到窗口显示后弹出，不阻塞首次绘制
+        self.auto_load_domains()
+        QTimer.singleShot(0, self.check_and_prompt_config)
+        
+        # 后台定时检查更新：窗口显示并完成首次绘制后首次检查，之后按结果重新计时
+        self._last_update_result = None
+        self._update_failures = 0
+        self._notified_version = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.timeout.connect(lambda: self.check_for_updates(show_no_update_msg=False))
+        self._update_timer.start(500)
+    
     def closeEvent(self, event):
-        self.safe_terminate_thread(self.worker_thread)
-        self.safe_terminate_thread(self.update_thread)
+        # 丢弃尚未开始的任务并通知进行中的任务停止，最多等待2秒
+        self._pool.clear()
+        if self.dns_client is not None:
+            self.dns_client.cancel()
+            self.dns_client = None
+        self._pool.waitForDone(2000)
         event.accept()
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._flush_pending_logs()
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self._flush_pending_logs()
+    
+    def wait_for_background_tasks(self, timeout=2000):
+        """等待线程池中的请求结束(各最多timeout毫秒)，避免退出时后台线程访问已销毁的对象
+        
+        全部结束返回True；超时返回False，此时调用方不应再走正常的解释器清理流程
+        """
+        dns_done = self._pool.waitForDone(timeout)
+        return QThreadPool.globalInstance().waitForDone(timeout) and dns_done
         
     def ensure_config_exists(self):
+        if DNSManagerUI._config_ensured:
+            return
         if not os.path.exists(CONFIG_PATH):
             default_config = {
                 'access_key_id': '',
@@ -450,385 +989,240 @@ class DNSManagerUI(QMainWindow):
                 'region_id': 'cn-hangzhou'
             }
             try:
-                with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-                    json.dump(default_config, f, ensure_ascii=False, indent=2)
+                _write_json_atomic(CONFIG_PATH, default_config)
             except Exception as e:
                 QMessageBox.warning(None, "配置文件创建失败", 
                                    f"无法创建配置文件: {str(e)}\n程序可能无法正常工作")
+                return
+        DNSManagerUI._config_ensured = True
     
     def init_ui(self):
         # 设置字体和窗口基本属性
         self.setWindowTitle(f"域名解析设置工具(阿里云){CURRENT_VERSION}")
-        self.setFixedSize(1000, 730)
+        self.resize(1000, 730)
+        self.setMinimumSize(900, 680)
 
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        images_dir = os.path.join(base_dir, "images")
-        try:
-            logo = QPixmap(os.path.join(images_dir, "logo.png"))
-            icon = QIcon(logo)
-            self.setWindowIcon(icon)
-        except:
-            pass
+        # 图标设置在应用上，配置弹窗和消息框自动沿用，无需各自加载
+        app_icon = _app_icon()
+        if not app_icon.isNull():
+            QApplication.setWindowIcon(app_icon)
 
         # 全局字体设置
-        base_font = QFont("Microsoft YaHei", 9)
-        self.setFont(base_font)
+        self.setFont(_FONT_BASE)
         
+        # 子控件通过objectName匹配全局样式表
         central_widget = QWidget()
-        central_widget.setStyleSheet("background-color: #F9FAFB;")
+        central_widget.setObjectName("central")
         self.setCentralWidget(central_widget)
         
-        # 标题区域
-        title_container = QFrame(central_widget)
-        title_container.setGeometry(30, 10, 940, 50)
-        title_container.setStyleSheet("background-color: transparent;")
-        
-        title_label = QLabel("域名解析设置工具(阿里云)", title_container)
-        title_font = QFont("Microsoft YaHei", 16, QFont.Bold)
-        title_label.setFont(title_font)
-        title_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        title_label.setStyleSheet("""
-            color: #EA580C; 
-            background-color: transparent;
-        """)
-        title_label.setGeometry(350, 0, 300, 50)
-        
-        # 右侧功能按钮 - 修复按钮显示问题
+        # 整体纵向布局，窗口缩放或高DPI下由布局统一计算几何
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(30, 10, 30, 15)
+        main_layout.setSpacing(18)
+        
+        # 标题区域：标题居中，功能按钮靠右，两者共用同一格
+        title_layout = QGridLayout()
+        title_layout.setContentsMargins(0, 0, 0, 0)
+        
+        title_label = QLabel("域名解析设置工具(阿里云)")
+        title_label.setObjectName("title")
+        title_label.setFont(_FONT_TITLE)
+        title_label.setMinimumHeight(50)
+        
+        # 右侧功能按钮
         button_layout = QHBoxLayout()
         button_layout.setSpacing(10)
         
         # 账号配置按钮
         self.config_btn = QPushButton("账号配置")
+        self.config_btn.setObjectName("headerBtn")
         self.config_btn.setFixedSize(100, 30)
         self.config_btn.clicked.connect(self.open_config_dialog)
         
         # 检查更新按钮
         self.check_update_btn = QPushButton("检查更新")
+        self.check_update_btn.setObjectName("headerBtn")
         self.check_update_btn.setFixedSize(100, 30)
-        self.check_update_btn.clicked.connect(lambda: self.check_for_updates(show_no_update_msg=True))
-        
-        # 按钮样式
-        self.config_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4F46E5;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: 600;
-                font-family: "Microsoft YaHei";
-                font-size: 9pt;
-            }
-            QPushButton:hover {
-                background-color: #4338CA;
-            }
-        """)
-        
-        self.check_update_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4F46E5;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: 600;
-                font-family: "Microsoft YaHei";
-                font-size: 9pt;
-            }
-            QPushButton:hover {
-                background-color: #4338CA;
-            }
-        """)
+        self.check_update_btn.clicked.connect(lambda: self.check_for_updates(show_no_update_msg=True, use_cache=False))
         
-        # 创建按钮容器并添加按钮 - 调整位置使按钮完全显示
-        btn_container = QWidget(title_container)
-        btn_container.setGeometry(720, 10, 220, 40)
         button_layout.addWidget(self.config_btn)
         button_layout.addWidget(self.check_update_btn)
-        btn_container.setLayout(button_layout)
+        title_layout.addWidget(title_label, 0, 0, Qt.AlignCenter)
+        title_layout.addLayout(button_layout, 0, 0, Qt.AlignRight | Qt.AlignVCenter)
+        main_layout.addLayout(title_layout)
         
         # 分割线
-        line = QFrame(central_widget)
+        line = QFrame()
+        line.setObjectName("divider")
         line.setFrameShape(QFrame.HLine)
         line.setFrameShadow(QFrame.Sunken)
-        line.setStyleSheet("background-color: #FECACA; margin-bottom: 10px;")
-        line.setGeometry(30, 70, 940, 2)
-        
-        # 按钮样式定义
-        button_style = """
-            QPushButton {
-                background-color: #F97316;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: 600;
-                font-family: "Microsoft YaHei";
-                font-size: 9pt;
-            }
-            QPushButton:hover {
-                background-color: #EA580C;
-            }
-            QPushButton:pressed {
-                background-color: #C2410C;
-            }
-            QPushButton:disabled {
-                background-color: #FED7D7;
-                color: #9CA3AF;
-            }
-        """
-        
-        primary_button_style = button_style + """
-            background-color: #EA580C;
-            padding: 8px 16px;
-        """
+        main_layout.addWidget(line)
         
         # 域名解析设置区域
-        self.domain_group = QGroupBox("域名解析设置", central_widget)
-        self.domain_group.setGeometry(30, 90, 940, 200)
-        self.domain_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 11pt;
-                font-weight: bold;
-                color: #374151;
-                font-family: "Microsoft YaHei";
-                border: 1px solid #FECACA;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding: 20px 15px 15px 15px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 5px 0 5px;
-                color: #F97316;
-            }
-        """)
+        self.domain_group = QGroupBox("域名解析设置")
+        domain_layout = QGridLayout(self.domain_group)
+        domain_layout.setContentsMargins(5, 0, 0, 0)
+        domain_layout.setHorizontalSpacing(10)
+        domain_layout.setVerticalSpacing(10)
+        # 表单保持紧凑，多余宽度留在最右侧
+        domain_layout.setColumnStretch(4, 1)
         
         # 域名解析设置区域内容
-        domain_label = QLabel("主域名:", self.domain_group)
-        domain_label.setStyleSheet("color: #374151; font-weight: 500; font-size: 9pt; font-family: 'Microsoft YaHei'; background-color: transparent;")
+        domain_label = QLabel("主域名:")
+        domain_label.setObjectName("fieldLabel")
         domain_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        domain_label.setGeometry(20, 30, 70, 30)
-        
-        self.domain_combo = QComboBox(self.domain_group)
-        self.domain_combo.setGeometry(100, 30, 500, 30)
-        self.domain_combo.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #FECACA;
-                border-radius: 4px;
-                padding: 5px 10px;
-                font-size: 9pt;
-                font-family: "Microsoft YaHei";
-                background-color: #FAFAFA;
-            }
-            QComboBox:focus {
-                border-color: #F97316;
-                background-color: white;
-            }
-        """)
+        domain_label.setFixedWidth(70)
+        
+        self.domain_combo = QComboBox()
+        self.domain_combo.setMinimumHeight(30)
         self.domain_combo.currentIndexChanged.connect(self.on_domain_changed)
         
-        refresh_domain_btn = QPushButton("刷新域名", self.domain_group)
-        refresh_domain_btn.setGeometry(620, 30, 90, 30)
-        refresh_domain_btn.setStyleSheet(button_style)
-        refresh_domain_btn.clicked.connect(self.refresh_domains)
+        refresh_domain_btn = QPushButton("刷新域名")
+        refresh_domain_btn.setFixedSize(90, 30)
+        refresh_domain_btn.clicked.connect(lambda: self.refresh_domains(force=True))
+        
+        domain_row = QHBoxLayout()
+        domain_row.setSpacing(20)
+        domain_row.addWidget(self.domain_combo, 1)
+        domain_row.addWidget(refresh_domain_btn)
         
-        subdomain_label = QLabel("子域名:", self.domain_group)
-        subdomain_label.setStyleSheet("color: #374151; font-weight: 500; font-size: 9pt; font-family: 'Microsoft YaHei'; background-color: transparent;")
+        subdomain_label = QLabel("子域名:")
+        subdomain_label.setObjectName("fieldLabel")
         subdomain_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        subdomain_label.setGeometry(20, 75, 70, 30)
-        
-        self.subdomain_edit = QLineEdit(self.domain_group)
-        self.subdomain_edit.setPlaceholderText("留空表示解析主域名")
-        self.subdomain_edit.setGeometry(100, 75, 200, 30)
-        self.subdomain_edit.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #FECACA;
-                border-radius: 4px;
-                padding: 5px 10px;
-                font-size: 9pt;
-                font-family: "Microsoft YaHei";
-                background-color: #FAFAFA;
-            }
-            QLineEdit:focus {
-                border-color: #F97316;
-                background-color: white;
-            }
-        """)
         
-        ip_label = QLabel("IP地址:", self.domain_group)
-        ip_label.setStyleSheet("color: #374151; font-weight: 500; font-size: 9pt; font-family: 'Microsoft YaHei'; background-color: transparent;")
+        self.subdomain_edit = QLineEdit()
+        self.subdomain_edit.setPlaceholderText("留空表示主域名，多个用逗号分隔")
+        self.subdomain_edit.setFixedWidth(200)
+        self.subdomain_edit.setMinimumHeight(30)
+        
+        ip_label = QLabel("IP地址:")
+        ip_label.setObjectName("fieldLabel")
         ip_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        ip_label.setGeometry(330, 75, 70, 30)
+        ip_label.setFixedWidth(80)
         
-        self.ip_edit = QLineEdit(self.domain_group)
+        self.ip_edit = QLineEdit()
         self.ip_edit.setPlaceholderText("支持IPV4/IPV6")
-        self.ip_edit.setGeometry(410, 75, 300, 30)
-        self.ip_edit.textChanged.connect(self.detect_ip_version)
-        self.ip_edit.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #FECACA;
-                border-radius: 4px;
-                padding: 5px 10px;
-                font-size: 9pt;
-                font-family: "Microsoft YaHei";
-                background-color: #FAFAFA;
-            }
-            QLineEdit:focus {
-                border-color: #F97316;
-                background-color: white;
-            }
-        """)
-        
-        self.ip_version_label = QLabel("IP版本: 未检测", self.domain_group)
-        self.ip_version_label.setStyleSheet("""
-            font-size: 8pt;
-            color: #6B7280;
-            font-family: "Microsoft YaHei";
-            background-color: transparent;
-        """)
-        self.ip_version_label.setGeometry(410, 110, 120, 20)
-        
-        self.set_record_btn = QPushButton("设置解析", self.domain_group)
-        self.set_record_btn.setGeometry(100, 140, 120, 35)
-        self.set_record_btn.setStyleSheet(primary_button_style)
+        self.ip_edit.setFixedWidth(300)
+        self.ip_edit.setMinimumHeight(30)
+        # 输入停顿后再检测IP版本，合并连续按键/粘贴触发的多次检测
+        self._ip_debounce = QTimer(self)
+        self._ip_debounce.setSingleShot(True)
+        self._ip_debounce.setInterval(150)
+        self._ip_debounce.timeout.connect(self.detect_ip_version)
+        self.ip_edit.textChanged.connect(self._ip_debounce.start)
+        
+        self.ip_version_label = QLabel("IP版本: 未检测")
+        self.ip_version_label.setObjectName("ipVersion")
+        
+        # IP版本提示文字和颜色，预先构建后按分类复用
+        self._ip_version_states = {
+            'empty': ("IP版本: 未检测", self._make_palette(QColor(107, 114, 128))),
+            4: ("IP版本: IPv4", self._make_palette(QColor(16, 185, 129))),
+            6: ("IP版本: IPv6", self._make_palette(QColor(59, 130, 246))),
+            'invalid': ("IP版本: 无效格式", self._make_palette(QColor(239, 68, 68)))
+        }
+        self._last_ip_class = None
+        self.detect_ip_version()
+        
+        self.set_record_btn = QPushButton("设置解析")
+        self.set_record_btn.setObjectName("primary")
+        self.set_record_btn.setFixedSize(120, 35)
         self.set_record_btn.clicked.connect(self.set_dns_record)
         
-        self.clear_btn = QPushButton("清空输入", self.domain_group)
-        self.clear_btn.setGeometry(240, 140, 120, 35)
-        self.clear_btn.setStyleSheet(button_style)
+        self.clear_btn = QPushButton("清空输入")
+        self.clear_btn.setFixedSize(120, 35)
         self.clear_btn.clicked.connect(self.clear_inputs)
         
-        # 已解析记录展示区域
-        self.records_group = QGroupBox("已解析记录", central_widget)
-        self.records_group.setGeometry(30, 310, 940, 230)
-        self.records_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 11pt;
-                font-weight: bold;
-                color: #374151;
-                font-family: "Microsoft YaHei";
-                border: 1px solid #FECACA;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding: 20px 15px 15px 15px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 5px 0 5px;
-                color: #F97316;
-            }
-        """)
+        action_row = QHBoxLayout()
+        action_row.setSpacing(20)
+        action_row.addWidget(self.set_record_btn)
+        action_row.addWidget(self.clear_btn)
+        action_row.addStretch()
+        
+        domain_layout.addWidget(domain_label, 0, 0)
+        domain_layout.addLayout(domain_row, 0, 1, 1, 3)
+        domain_layout.addWidget(subdomain_label, 1, 0)
+        domain_layout.addWidget(self.subdomain_edit, 1, 1)
+        domain_layout.addWidget(ip_label, 1, 2)
+        domain_layout.addWidget(self.ip_edit, 1, 3)
+        domain_layout.addWidget(self.ip_version_label, 2, 3)
+        domain_layout.addLayout(action_row, 3, 1, 1, 3)
+        main_layout.addWidget(self.domain_group)
+        
+        # 已解析记录展示区域，窗口增高时由它占用多出的空间
+        self.records_group = QGroupBox("已解析记录")
+        records_layout = QVBoxLayout(self.records_group)
+        records_layout.setContentsMargins(0, 0, 0, 0)
         
         # 解析记录表格
-        self.records_table = QTableWidget(self.records_group)
-        self.records_table.setGeometry(10, 30, 910, 180)
-        self.records_table.setColumnCount(5)
-        self.records_table.setHorizontalHeaderLabels(["完整域名", "记录类型", "IP地址", "状态", "操作"])
-        
-        self.records_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)  # 完整域名自动拉伸
-        self.records_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)  # 记录类型
-        self.records_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)  # IP地址
-        self.records_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)  # 状态
-        self.records_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Fixed)  # 操作
+        self.records_model = RecordsModel(self)
+        self.records_table = QTableView()
+        self.records_table.setModel(self.records_model)
+        # 按行多选，选中后按Delete键或通过右键菜单批量删除
+        self.records_table.setSelectionBehavior(QTableView.SelectRows)
+        self.records_table.setSelectionMode(QTableView.ExtendedSelection)
+        delete_selected_action = QAction("删除选中记录", self.records_table)
+        delete_selected_action.setShortcut(QKeySequence.Delete)
+        delete_selected_action.setShortcutContext(Qt.WidgetShortcut)
+        delete_selected_action.triggered.connect(self.delete_selected_records)
+        self.records_table.addAction(delete_selected_action)
+        self.records_table.setContextMenuPolicy(Qt.ActionsContextMenu)
+        records_layout.addWidget(self.records_table)
+        main_layout.addWidget(self.records_group, 1)
+        
+        header = self.records_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)  # 完整域名自动拉伸
+        header.setSectionResizeMode(2, QHeaderView.Stretch)  # IP地址
+        # 记录类型、状态列的内容都不比表头宽，按表头定宽，刷新记录时不再逐行测量内容
+        header.ensurePolished()
+        for column in (1, 3):
+            header.setSectionResizeMode(column, QHeaderView.Fixed)
+            header.resizeSection(column, header.sectionSizeHint(column))
+        header.setSectionResizeMode(4, QHeaderView.Fixed)  # 操作
         self.records_table.setColumnWidth(4, 210)
         self.records_table.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.records_table.verticalHeader().setMinimumSectionSize(40)
         
-        self.records_table.setStyleSheet("""
-            QTableWidget {
-                border: 1px solid #FECACA;
-                border-radius: 4px;
-                background-color: #FAFAFA;
-                font-family: "Microsoft YaHei";
-                font-size: 8.5pt;
-            }
-            QHeaderView::section {
-                background-color: #FEE2E2;
-                color: #374151;
-                padding: 5px;
-                border: 1px solid #FECACA;
-                font-weight: bold;
-                font-size: 8.5pt;
-            }
-            QTableWidget::item {
-                padding: 5px;
-                border-bottom: 1px solid #FEE2E2;
-            }
-            QTableWidget::item:selected {
-                background-color: #FFEDD5;
-                color: #C2410C;
-            }
-        """)
+        # 操作列按钮由委托绘制，无需为每行创建按钮控件
+        self.action_delegate = ActionDelegate(self.records_table)
+        self.action_delegate.toggle_requested.connect(
+            lambda record: self.toggle_record_status(record['record_id'], 'disable' if record['status'] == 'ENABLE' else 'ENABLE'))
+        self.action_delegate.delete_requested.connect(
+            lambda record: self.delete_record(record['record_id'], record['full_domain']))
+        self.records_table.setItemDelegateForColumn(4, self.action_delegate)
         
         # 操作日志区域
-        self.log_group = QGroupBox("操作日志", central_widget)
-        self.log_group.setGeometry(30, 560, 940, 120)
-        self.log_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 11pt;
-                font-weight: bold;
-                color: #374151;
-                font-family: "Microsoft YaHei";
-                border: 1px solid #FECACA;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding: 10px 15px 5px 15px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 5px 0 5px;
-                color: #F97316;
-            }
-        """)
+        self.log_group = QGroupBox("操作日志")
+        self.log_group.setObjectName("logGroup")
+        log_layout = QVBoxLayout(self.log_group)
+        log_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.log_text = QTextEdit(self.log_group)
+        self.log_text = QPlainTextEdit()
+        self.log_text.setObjectName("log")
         self.log_text.setReadOnly(True)
-        self.log_text.setLineWrapMode(QTextEdit.WidgetWidth)
-        self.log_text.setGeometry(10, 20, 910, 90)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #FECACA;
-                border-radius: 4px;
-                background-color: #FAFAFA;
-                font-family: "Microsoft YaHei", Consolas, 'Courier New', monospace;
-                font-size: 8.5pt;
-                padding: 3px;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: transparent;
-                width: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(249, 115, 22, 0.5);
-                min-height: 20px;
-                border-radius: 3px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        self.log_text.setLineWrapMode(QPlainTextEdit.WidgetWidth)
+        # 只保留最近LOG_MAX_LINES条日志，避免日志过多卡死，由Qt自动裁剪最早的内容
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
+        self.log_text.setFixedHeight(90)
+        log_layout.addWidget(self.log_text)
+        main_layout.addWidget(self.log_group)
+        
+        # 日志前缀的字符格式，直接插入文本，省去HTML解析
+        self._fmt_ok = QTextCharFormat()
+        self._fmt_ok.setForeground(QColor("#10B981"))
+        self._fmt_err = QTextCharFormat()
+        self._fmt_err.setForeground(QColor("#EF4444"))
+        self._fmt_plain = QTextCharFormat()
         
         # 状态栏
-        self.statusBar().setStyleSheet("""
-            background-color: #F9FAFB; 
-            color: #374151; 
-            border-top: 1px solid #FECACA;
-            font-size: 8.5pt;
-            font-family: "Microsoft YaHei";
-        """)
+        self.statusBar().setObjectName("mainStatus")
         self.statusBar().showMessage("就绪")
-        
-        self.check_and_prompt_config()
-        self.auto_load_domains()
+    
+    @staticmethod
+    def _make_palette(color):
+        palette = QPalette()
+        palette.setColor(QPalette.WindowText, color)
+        return palette
     
     def open_config_dialog(self):
         """打开账号配置弹窗"""
@@ -837,343 +1231,320 @@ class DNSManagerUI(QMainWindow):
     
     def check_and_prompt_config(self):
         try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                access_key_id = config.get('access_key_id', '').strip()
-                access_key_secret = config.get('access_key_secret', '').strip()
-                
-                if not access_key_id or not access_key_secret:
-                    reply = QMessageBox.question(
-                        self, "配置不完整", 
-                        "检测到配置文件不完整，是否现在进行配置？",
-                        QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
-                    )
-                    if reply == QMessageBox.Yes:
-                        self.open_config_dialog()
+            access_key_id, access_key_secret, _ = self._creds()
+            
+            if not access_key_id or not access_key_secret:
+                reply = QMessageBox.question(
+                    self, "配置不完整", 
+                    "检测到配置文件不完整，是否现在进行配置？",
+                    QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+                )
+                if reply == QMessageBox.Yes:
+                    self.open_config_dialog()
         except Exception:
             pass
     
     def auto_load_domains(self):
         try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                access_key_id = config.get('access_key_id', '').strip()
-                access_key_secret = config.get('access_key_secret', '').strip()
-                
-                if access_key_id and access_key_secret:
-                    self.log("正在加载域名列表...")
-                    self.refresh_domains()
-                else:
-                    self.log("请点击'账号配置'按钮设置AccessKey信息", False)
+            access_key_id, access_key_secret, _ = self._creds()
+            
+            if access_key_id and access_key_secret:
+                self.log("正在加载域名列表...")
+                self.refresh_domains()
+            else:
+                self.log("请点击'账号配置'按钮设置AccessKey信息", False)
         except Exception:
             self.log("请点击'账号配置'按钮设置AccessKey信息", False)
     
     def detect_ip_version(self):
         ip_address = self.ip_edit.text().strip()
-        if not ip_address:
-            self.ip_version_label.setText("IP版本: 未检测")
-            palette = QPalette()
-            palette.setColor(QPalette.WindowText, QColor(107, 114, 128))
-            self.ip_version_label.setPalette(palette)
+        ip_class = (_classify_ip(ip_address) or 'invalid') if ip_address else 'empty'
+        # 分类未变化时(如有效IP后继续输入仍无效)无需刷新标签
+        if ip_class == self._last_ip_class:
             return
-            
-        if self.is_valid_ipv4(ip_address):
-            self.ip_version_label.setText("IP版本: IPv4")
-            palette = QPalette()
-            palette.setColor(QPalette.WindowText, QColor(16, 185, 129))
-            self.ip_version_label.setPalette(palette)
-        elif self.is_valid_ipv6(ip_address):
-            self.ip_version_label.setText("IP版本: IPv6")
-            palette = QPalette()
-            palette.setColor(QPalette.WindowText, QColor(59, 130, 246))
-            self.ip_version_label.setPalette(palette)
-        else:
-            self.ip_version_label.setText("IP版本: 无效格式")
-            palette = QPalette()
-            palette.setColor(QPalette.WindowText, QColor(239, 68, 68))
-            self.ip_version_label.setPalette(palette)
+        self._last_ip_class = ip_class
+        
+        text, palette = self._ip_version_states[ip_class]
+        self.ip_version_label.setText(text)
+        self.ip_version_label.setPalette(palette)
     
     def log(self, message, is_success=True):
-        prefix = "[成功] " if is_success else "[错误] "
-        color = "#10B981" if is_success else "#EF4444"
-        self.log_text.append(f'<span style="color:{color}">{prefix}</span>{message}')
-        self.log_text.moveCursor(self.log_text.textCursor().End)
-        
-        # 只保留最近20条日志，避免日志过多卡死
-        log_count = self.log_text.document().blockCount()
-        if log_count > 20:
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(cursor.Start)
-            cursor.movePosition(cursor.NextBlock, cursor.KeepAnchor, log_count - 20)
-            cursor.removeSelectedText()
-            cursor.deleteChar()
+        if self.log_text.isVisible() and not self.isMinimized():
+            self._append_log(message, is_success)
+            # moveCursor自带滚动到可见位置
+            self.log_text.moveCursor(QTextCursor.End)
+        else:
+            self._pending_logs.append((message, is_success))
             
         self.statusBar().showMessage(message, 5000)
     
-    def refresh_domains(self):
-        self.safe_terminate_thread(self.worker_thread)
-        
+    def _append_log(self, message, is_success):
+        prefix = "[成功] " if is_success else "[错误] "
+        cursor = self.log_text.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        if not self.log_text.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(prefix, self._fmt_ok if is_success else self._fmt_err)
+        cursor.insertText(message, self._fmt_plain)
+    
+    def _flush_pending_logs(self):
+        """把隐藏期间暂存的日志写入日志框，只滚动一次"""
+        if not self._pending_logs:
+            return
+        while self._pending_logs:
+            self._append_log(*self._pending_logs.popleft())
+        self.log_text.moveCursor(QTextCursor.End)
+    
+    def refresh_domains(self, force=False):
         try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                access_key_id = config.get('access_key_id', '').strip()
-                access_key_secret = config.get('access_key_secret', '').strip()
-                region_id = config.get('region_id', 'cn-hangzhou').strip() or 'cn-hangzhou'
-                
-                if not access_key_id or not access_key_secret:
-                    QMessageBox.warning(self, "配置不完整", "请先完成账号配置")
-                    self.open_config_dialog()
-                    return
-                
-                self.log("正在刷新域名列表...")
-                self.domain_combo.clear()
-                
-                self.worker_thread = WorkerThread(self._fetch_domains, access_key_id, access_key_secret, region_id)
-                self.worker_thread.signal.connect(self.on_worker_finished)
-                self.worker_thread.domain_signal.connect(self.update_domain_combo)
-                self.worker_thread.start()
+            access_key_id, access_key_secret, region_id = self._creds()
+            
+            if not access_key_id or not access_key_secret:
+                QMessageBox.warning(self, "配置不完整", "请先完成账号配置")
+                self.open_config_dialog()
+                return
+            
+            self.log("正在刷新域名列表...")
+            
+            client = self.get_dns_client(access_key_id, access_key_secret, region_id)
+            if force:
+                # 手动刷新时跳过缓存，并重新加载当前域名的记录
+                client.invalidate()
+            self._domains_gen += 1
+            gen = self._domains_gen
+            worker = Worker(self._fetch_domains, client, gen)
+            worker.signals.signal.connect(self.on_worker_finished)
+            worker.signals.domain_signal.connect(
+                lambda domains: self._show_domains(gen, domains, force))
+            self._pool.start(worker)
         except Exception as e:
             self.log(f"加载配置失败: {str(e)}", False)
             QMessageBox.warning(self, "配置错误", f"加载配置失败: {str(e)}\n请重新配置")
             self.open_config_dialog()
     
-    def _fetch_domains(self, access_key_id, access_key_secret, region_id):
-        self.dns_client = AliyunDNSClient(access_key_id, access_key_secret, region_id)
-        domains = self.dns_client.get_domains()
+    def _creds(self):
+        """返回配置中的 (access_key_id, access_key_secret, region_id)，文件修改后才重新读取"""
+        stat = os.stat(CONFIG_PATH)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp != self._config_stamp:
+            config = _read_json(CONFIG_PATH)
+            self._config_creds = (config.get('access_key_id', '').strip(),
+                                  config.get('access_key_secret', '').strip(),
+                                  config.get('region_id', 'cn-hangzhou').strip() or 'cn-hangzhou')
+            self._config_stamp = stamp
+        return self._config_creds
+    
+    def get_dns_client(self, access_key_id, access_key_secret, region_id):
+        """凭据未变化时复用已有客户端，保留其连接池"""
+        key = (access_key_id, access_key_secret, region_id)
+        if self.dns_client is None or key != self._client_key:
+            self.dns_client = AliyunDNSClient(access_key_id, access_key_secret, region_id)
+            self._client_key = key
+        return self.dns_client
+    
+    def _fetch_domains(self, signals, client, gen):
+        # 排队期间又发起了刷新，由最新的任务去请求
+        if gen != self._domains_gen:
+            return ""
+        domains = client.get_domains()
         
-        self.worker_thread.domain_signal.emit(domains)
+        signals.domain_signal.emit(domains)
         
         if not domains:
             return "未找到任何域名，请先在阿里云控制台添加域名"
         return f"成功加载 {len(domains)} 个域名"
     
-    def update_domain_combo(self, domains):
-        self.domain_combo.clear()
-        self.domain_combo.addItems(domains)
+    def _show_domains(self, gen, domains, reload_records):
+        if gen == self._domains_gen:
+            self.update_domain_combo(domains, reload_records)
+    
+    def update_domain_combo(self, domains, reload_records=False):
+        """更新域名下拉框并保留原选中的域名，选中项变化或要求重新加载时才拉取记录"""
+        combo = self.domain_combo
+        current = combo.currentText()
+        if domains != self._last_domains:
+            self._last_domains = list(domains)
+            
+            # 重建期间屏蔽信号与重绘，避免清空和逐项添加时反复触发记录加载
+            combo.setUpdatesEnabled(False)
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(domains)
+            if current in domains:
+                combo.setCurrentIndex(domains.index(current))
+            combo.blockSignals(False)
+            combo.setUpdatesEnabled(True)
+            combo.update()
+        
+        if reload_records or combo.currentText() != current:
+            self.on_domain_changed(combo.currentIndex())
     
     def on_domain_changed(self, index):
         if index < 0:
             return
             
-        self.safe_terminate_thread(self.worker_thread)
-        
         main_domain = self.domain_combo.currentText()
         if not main_domain:
             return
             
         self.log(f"正在加载 {main_domain} 的解析记录...")
-        self.records_table.setRowCount(0)
+        self.records_model.set_records([])
         
         try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                access_key_id = config.get('access_key_id', '').strip()
-                access_key_secret = config.get('access_key_secret', '').strip()
-                region_id = config.get('region_id', 'cn-hangzhou').strip() or 'cn-hangzhou'
-                
-                def fetch_records_func():
-                    if not self.dns_client:
-                        self.dns_client = AliyunDNSClient(access_key_id, access_key_secret, region_id)
-                    
-                    records = self.dns_client.get_domain_records(main_domain)
-                    self.worker_thread.records_signal.emit(records)
-                    return f"成功加载 {main_domain} 的 {len(records)} 条解析记录"
-                
-                self.worker_thread = WorkerThread(fetch_records_func)
-                self.worker_thread.signal.connect(self.on_worker_finished)
-                self.worker_thread.records_signal.connect(self.update_records_table)
-                self.worker_thread.start()
+            access_key_id, access_key_secret, region_id = self._creds()
+            
+            client = self.get_dns_client(access_key_id, access_key_secret, region_id)
+            gen = self._new_records_request()
+            worker = Worker(self._fetch_records, client, main_domain, gen)
+            worker.signals.signal.connect(self.on_worker_finished)
+            worker.signals.records_signal.connect(lambda records: self._show_records(gen, records))
+            self._pool.start(worker)
         except Exception as e:
             self.log(f"加载配置失败: {str(e)}", False)
     
+    def _fetch_records(self, signals, client, main_domain, gen):
+        # 排队期间已切换到其他域名，不再请求已过期的记录
+        if gen != self._records_gen:
+            return ""
+        records = client.get_domain_records(main_domain)
+        signals.records_signal.emit(records)
+        return f"成功加载 {main_domain} 的 {len(records)} 条解析记录"
+    
+    def _new_records_request(self):
+        """登记一次记录查询并返回其代号，之后登记的查询会使此前请求回传的记录作废"""
+        self._records_gen += 1
+        return self._records_gen
+    
+    def _show_records(self, gen, records):
+        if gen == self._records_gen:
+            self.update_records_table(records)
+    
     def update_records_table(self, records):
-        self.records_table.setRowCount(len(records))
-        
-        for row, record in enumerate(records):
-            # 完整域名
-            full_domain_item = QTableWidgetItem(record['full_domain'])
-            full_domain_item.setFlags(full_domain_item.flags() & ~Qt.ItemIsEditable)
-            
-            # 记录类型
-            type_item = QTableWidgetItem(record['type'])
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            if record['type'] == 'A':
-                type_item.setForeground(QColor(16, 185, 129))
-            else:
-                type_item.setForeground(QColor(59, 130, 246))
-            
-            # IP地址
-            ip_item = QTableWidgetItem(record['value'])
-            ip_item.setFlags(ip_item.flags() & ~Qt.ItemIsEditable)
-            
-            # 状态
-            status_item = QTableWidgetItem("启用" if record['status'] == 'ENABLE' else "暂停")
-            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-            if record['status'] == 'ENABLE':
-                status_item.setForeground(QColor(16, 185, 129))
-            else:
-                status_item.setForeground(QColor(239, 68, 68))
-            
-            # 操作按钮
-            btn_widget = QWidget()
-            hbox = QHBoxLayout(btn_widget)
-            hbox.setContentsMargins(0, 0, 0, 0)
-            
-            
-            if record['status'] == 'ENABLE':
-                pause_btn = QPushButton("暂停")
-                pause_btn.setFixedSize(60, 20)
-                pause_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #F59E0B;
-                        color: white;
-                        border: none;
-                        border-radius: 3px;
-                        padding: 2px 8px;
-                        font-size: 8pt;
-                    }
-                    QPushButton:hover {
-                        background-color: #D97706;
-                    }
-                """)
-                pause_btn.clicked.connect(lambda checked, rid=record['record_id']: self.toggle_record_status(rid, 'disable'))
-                hbox.addWidget(pause_btn)
-            else:
-                enable_btn = QPushButton("启用")
-                enable_btn.setFixedSize(60, 20)
-                enable_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #10B981;
-                        color: white;
-                        border: none;
-                        border-radius: 3px;
-                        padding: 2px 8px;
-                        font-size: 8pt;
-                    }
-                    QPushButton:hover {
-                        background-color: #059669;
-                    }
-                """)
-                enable_btn.clicked.connect(lambda checked, rid=record['record_id']: self.toggle_record_status(rid, 'ENABLE'))
-                hbox.addWidget(enable_btn)
-            
-            delete_btn = QPushButton("删除")
-            delete_btn.setFixedSize(60, 20)
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #EF4444;
-                    color: white;
-                    border: none;
-                    border-radius: 3px;
-                    padding: 2px 8px;
-                    font-size: 8pt;
-                }
-                QPushButton:hover {
-                    background-color: #DC2626;
-                }
-            """)
-            delete_btn.clicked.connect(lambda checked, rid=record['record_id'], domain=record['full_domain']: self.delete_record(rid, domain))
-            hbox.addWidget(delete_btn)
-            
-            btn_widget.setLayout(hbox)
-            
-            # 设置表格内容
-            self.records_table.setItem(row, 0, full_domain_item)
-            self.records_table.setItem(row, 1, type_item)
-            self.records_table.setItem(row, 2, ip_item)
-            self.records_table.setItem(row, 3, status_item)
-            self.records_table.setCellWidget(row, 4, btn_widget)
+        # 文字列由模型提供，操作列由委托绘制，整表只需一次模型重置
+        self.records_model.set_records(records)
     
     def toggle_record_status(self, record_id, status):
-        self.safe_terminate_thread(self.worker_thread)
-        
         action = "暂停" if status == 'disable' else "启用"
         self.log(f"正在{action}解析记录...")
         
         try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                access_key_id = config.get('access_key_id', '').strip()
-                access_key_secret = config.get('access_key_secret', '').strip()
-                region_id = config.get('region_id', 'cn-hangzhou').strip() or 'cn-hangzhou'
-                
-                def toggle_func():
-                    if not self.dns_client:
-                        self.dns_client = AliyunDNSClient(access_key_id, access_key_secret, region_id)
-                    
-                    self.dns_client.set_record_status(record_id, status)
-                    main_domain = self.domain_combo.currentText()
-                    records = self.dns_client.get_domain_records(main_domain)
-                    self.worker_thread.records_signal.emit(records)
-                    return f"解析记录已成功{action}"
-                
-                self.worker_thread = WorkerThread(toggle_func)
-                self.worker_thread.signal.connect(self.on_worker_finished)
-                self.worker_thread.records_signal.connect(self.update_records_table)
-                self.worker_thread.start()
+            access_key_id, access_key_secret, region_id = self._creds()
+            
+            client = self.get_dns_client(access_key_id, access_key_secret, region_id)
+            # 在GUI线程取出当前域名，工作线程中不访问控件
+            main_domain = self.domain_combo.currentText()
+            
+            # 写操作不作废之前的查询结果，只在期间没有发起新查询时刷新表格
+            gen = self._records_gen
+            worker = Worker(self._run_toggle_status, client, main_domain, record_id, status, action)
+            worker.signals.signal.connect(self.on_worker_finished)
+            worker.signals.records_signal.connect(lambda records: self._show_records(gen, records))
+            self._pool.start(worker)
         except Exception as e:
             self.log(f"加载配置失败: {str(e)}", False)
     
+    def _run_toggle_status(self, signals, client, main_domain, record_id, status, action):
+        client.set_record_status(record_id, status)
+        records = client.get_domain_records(main_domain)
+        signals.records_signal.emit(records)
+        return f"解析记录已成功{action}"
+    
+    def _confirm_delete(self, target):
+        """删除前确认，勾选"本次会话不再提示"后本次运行内不再询问"""
+        if self._skip_delete_confirm:
+            return True
+        
+        box = QMessageBox(QMessageBox.Question, "确认删除",
+                          f"确定要删除{target}吗？\n此操作不可恢复！",
+                          QMessageBox.Yes | QMessageBox.No, self)
+        box.setDefaultButton(QMessageBox.No)
+        skip_check = QCheckBox("本次会话不再提示")
+        box.setCheckBox(skip_check)
+        if box.exec_() != QMessageBox.Yes:
+            return False
+        self._skip_delete_confirm = skip_check.isChecked()
+        return True
+    
     def delete_record(self, record_id, domain):
-        first_confirm = QMessageBox.question(
-            self, "确认删除", 
-            f"确定要删除解析记录 {domain} 吗？\n此操作不可恢复！",
-            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-        )
-        
-        if first_confirm != QMessageBox.Yes:
-            return
-            
-        second_confirm = QMessageBox.question(
-            self, "再次确认", 
-            f"请再次确认删除解析记录 {domain}？\n这是最后一次确认！",
-            QMessageBox.Yes | QMessageBox.No, QMessageBox.No
-        )
-        
-        if second_confirm != QMessageBox.Yes:
+        if not self._confirm_delete(f"解析记录 {domain} "):
             return
         
-        self.safe_terminate_thread(self.worker_thread)
         self.log(f"正在删除解析记录 {domain}...")
         
         try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                access_key_id = config.get('access_key_id', '').strip()
-                access_key_secret = config.get('access_key_secret', '').strip()
-                region_id = config.get('region_id', 'cn-hangzhou').strip() or 'cn-hangzhou'
-                
-                def delete_func():
-                    if not self.dns_client:
-                        self.dns_client = AliyunDNSClient(access_key_id, access_key_secret, region_id)
-                    
-                    self.dns_client.delete_record(record_id)
-                    main_domain = self.domain_combo.currentText()
-                    records = self.dns_client.get_domain_records(main_domain)
-                    self.worker_thread.records_signal.emit(records)
-                    return f"解析记录 {domain} 已成功删除"
-                
-                self.worker_thread = WorkerThread(delete_func)
-                self.worker_thread.signal.connect(self.on_worker_finished)
-                self.worker_thread.records_signal.connect(self.update_records_table)
-                self.worker_thread.start()
+            access_key_id, access_key_secret, region_id = self._creds()
+            
+            client = self.get_dns_client(access_key_id, access_key_secret, region_id)
+            # 在GUI线程取出当前域名，工作线程中不访问控件
+            main_domain = self.domain_combo.currentText()
+            
+            # 写操作不作废之前的查询结果，只在期间没有发起新查询时刷新表格
+            gen = self._records_gen
+            worker = Worker(self._run_delete_record, client, main_domain, record_id, domain)
+            worker.signals.signal.connect(self.on_worker_finished)
+            worker.signals.records_signal.connect(lambda records: self._show_records(gen, records))
+            self._pool.start(worker)
         except Exception as e:
             self.log(f"加载配置失败: {str(e)}", False)
     
-    def on_worker_finished(self, message, success):
-        self.log(message, success)
+    def _run_delete_record(self, signals, client, main_domain, record_id, domain):
+        client.delete_record(record_id)
+        records = client.get_domain_records(main_domain)
+        signals.records_signal.emit(records)
+        return f"解析记录 {domain} 已成功删除"
+    
+    def delete_selected_records(self):
+        rows = sorted({index.row() for index in self.records_table.selectionModel().selectedRows()})
+        selected = [self.records_model.records[row] for row in rows]
+        if not selected:
+            return
+        if len(selected) == 1:
+            self.delete_record(selected[0]['record_id'], selected[0]['full_domain'])
+            return
+        if not self._confirm_delete(f"选中的 {len(selected)} 条解析记录"):
+            return
+        
+        self.log(f"正在删除 {len(selected)} 条解析记录...")
+        
+        try:
+            access_key_id, access_key_secret, region_id = self._creds()
+            
+            client = self.get_dns_client(access_key_id, access_key_secret, region_id)
+            main_domain = self.domain_combo.currentText()
+            
+            # 写操作不作废之前的查询结果，只在期间没有发起新查询时刷新表格
+            gen = self._records_gen
+            worker = Worker(self.bulk_delete_records, client, main_domain, selected)
+            worker.signals.signal.connect(self.on_worker_finished)
+            worker.signals.records_signal.connect(lambda records: self._show_records(gen, records))
+            self._pool.start(worker)
+        except Exception as e:
+            self.log(f"加载配置失败: {str(e)}", False)
     
-    def is_valid_ipv4(self, ip):
-        pattern = re.compile(r'^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
-        return pattern.match(ip) is not None
+    def bulk_delete_records(self, signals, client, main_domain, selected):
+        """并发删除多条记录，全部完成后统一刷新一次记录列表"""
+        results = client.delete_records([record['record_id'] for record in selected])
+        errors = [f"{record['full_domain']}: {error}"
+                  for record, error in zip(selected, results) if error]
+        
+        records = client.get_domain_records(main_domain)
+        signals.records_signal.emit(records)
+        
+        summary = f"批量删除 {len(selected)} 条解析记录，成功 {len(selected) - len(errors)} 条"
+        if errors:
+            raise Exception(f"{summary}，失败 {len(errors)} 条: {'; '.join(errors)}")
+        return summary
     
-    def is_valid_ipv6(self, ip):
-        pattern = re.compile(r'^([0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}$')
-        return pattern.match(ip) is not None
+    def on_worker_finished(self, message, success):
+        # 被跳过的过期查询不回传消息
+        if message:
+            self.log(message, success)
     
     def set_dns_record(self):
         main_domain = self.domain_combo.currentText()
-        sub_domain = self.subdomain_edit.text().strip() or '@'
+        # 支持以逗号分隔多个主机记录，去重并保持输入顺序
+        parts = [part.strip() for part in re.split(r'[,，]', self.subdomain_edit.text())]
+        sub_domains = list(dict.fromkeys(part for part in parts if part)) or ['@']
         ip_address = self.ip_edit.text().strip()
         
         if not main_domain:
@@ -1184,68 +1555,105 @@ class DNSManagerUI(QMainWindow):
             QMessageBox.warning(self, "输入错误", "请输入IP地址")
             return
             
-        record_type = "A" if self.is_valid_ipv4(ip_address) else "AAAA" if self.is_valid_ipv6(ip_address) else None
+        record_type = _RECORD_TYPE_BY_VERSION.get(_classify_ip(ip_address))
         if not record_type:
             QMessageBox.warning(self, "输入错误", "请输入有效的IPv4或IPv6地址")
             return
         
-        self.safe_terminate_thread(self.worker_thread)
-        self.log(f"正在设置 {sub_domain}.{main_domain} 的解析记录...")
+        self.log(f"正在设置 {'、'.join(_full_domain(rr, main_domain) for rr in sub_domains)} 的解析记录...")
         
         try:
-            with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                access_key_id = config.get('access_key_id', '').strip()
-                access_key_secret = config.get('access_key_secret', '').strip()
-                region_id = config.get('region_id', 'cn-hangzhou').strip() or 'cn-hangzhou'
-                
-                def set_record_func():
-                    if not self.dns_client:
-                        self.dns_client = AliyunDNSClient(access_key_id, access_key_secret, region_id)
-                    
-                    record_id = self.dns_client.get_record_id(main_domain, sub_domain, record_type)
-                    
-                    if record_id:
-                        self.dns_client.update_record(record_id, main_domain, sub_domain, ip_address, record_type)
-                        result = f"已更新 {sub_domain}.{main_domain} 的{record_type}记录为 {ip_address}"
-                    else:
-                        self.dns_client.add_record(main_domain, sub_domain, ip_address, record_type)
-                        result = f"已添加 {sub_domain}.{main_domain} 的{record_type}记录为 {ip_address}"
-                    
-                    records = self.dns_client.get_domain_records(main_domain)
-                    self.worker_thread.records_signal.emit(records)
-                    return result
-                
-                self.worker_thread = WorkerThread(set_record_func)
-                self.worker_thread.signal.connect(self.on_worker_finished)
-                self.worker_thread.records_signal.connect(self.update_records_table)
-                self.worker_thread.start()
+            access_key_id, access_key_secret, region_id = self._creds()
+            
+            client = self.get_dns_client(access_key_id, access_key_secret, region_id)
+            
+            # 写操作不作废之前的查询结果，只在期间没有发起新查询时刷新表格
+            gen = self._records_gen
+            if len(sub_domains) > 1:
+                worker = Worker(self.bulk_set_records, client, main_domain, sub_domains, ip_address, record_type)
+            else:
+                worker = Worker(self._run_set_record, client, main_domain, sub_domains[0], ip_address, record_type)
+            worker.signals.signal.connect(self.on_worker_finished)
+            worker.signals.records_signal.connect(lambda records: self._show_records(gen, records))
+            self._pool.start(worker)
         except Exception as e:
             self.log(f"加载配置失败: {str(e)}", False)
     
+    def _run_set_record(self, signals, client, main_domain, sub_domain, ip_address, record_type):
+        (action, error), = client.apply_updates(main_domain, [(sub_domain, ip_address, record_type)])
+        if error:
+            raise error
+        
+        records = client.get_domain_records(main_domain)
+        signals.records_signal.emit(records)
+        
+        full_domain = _full_domain(sub_domain, main_domain)
+        if action == 'unchanged':
+            return f"{full_domain} 的{record_type}记录已是 {ip_address}，无需更新"
+        if action == 'updated':
+            return f"已更新 {full_domain} 的{record_type}记录为 {ip_address}"
+        return f"已添加 {full_domain} 的{record_type}记录为 {ip_address}"
+    
+    def bulk_set_records(self, signals, client, main_domain, sub_domains, ip_address, record_type):
+        """批量设置多个主机记录，全部完成后统一刷新一次记录列表"""
+        results = client.apply_updates(main_domain, [(sub_domain, ip_address, record_type)
+                                                     for sub_domain in sub_domains])
+        errors = [f"{_full_domain(sub_domain, main_domain)}: {error}"
+                  for sub_domain, (_, error) in zip(sub_domains, results) if error]
+        
+        records = client.get_domain_records(main_domain)
+        signals.records_signal.emit(records)
+        
+        summary = f"批量设置 {len(sub_domains)} 条{record_type}记录为 {ip_address}，成功 {len(sub_domains) - len(errors)} 条"
+        if errors:
+            raise Exception(f"{summary}，失败 {len(errors)} 条: {'; '.join(errors)}")
+        return summary
+    
     def clear_inputs(self):
         self.subdomain_edit.clear()
         self.ip_edit.clear()
         self.log("已清空输入")
     
-    def check_for_updates(self, show_no_update_msg):
-        self.safe_terminate_thread(self.update_thread)
-        self.update_thread = UpdateCheckThread()
-        self.update_thread.update_available.connect(self.on_update_available)
-        self.update_thread.no_update.connect(lambda: self.on_no_update(show_no_update_msg))
-        self.update_thread.check_failed.connect(self.on_update_check_failed)
-        self.update_thread.start()
+    def check_for_updates(self, show_no_update_msg, use_cache=True):
+        # 一小时内已有检查结果时直接展示，不再请求GitHub
+        if self._last_update_result and time.time() - self._last_update_result[1] < UPDATE_RESULT_TTL:
+            self.show_update_result(self._last_update_result[0], show_no_update_msg)
+            return
+        
+        worker = UpdateCheckWorker(use_cache)
+        worker.signals.update_available.connect(lambda version: self.on_update_checked(version, show_no_update_msg))
+        worker.signals.no_update.connect(lambda: self.on_update_checked(None, show_no_update_msg))
+        worker.signals.check_failed.connect(self.on_update_check_failed)
+        QThreadPool.globalInstance().start(worker)
+    
+    def on_update_checked(self, latest_version, show_msg):
+        """记录检查结果并安排下一次后台检查，latest_version为None表示已是最新"""
+        self._last_update_result = (latest_version, time.time())
+        self._update_failures = 0
+        self._update_timer.start(UPDATE_CACHE_TTL * 1000)
+        self.show_update_result(latest_version, show_msg)
     
-    def on_update_available(self, latest_version):
+    def show_update_result(self, latest_version, show_msg):
+        if latest_version:
+            self.on_update_available(latest_version, show_msg)
+        else:
+            self.on_no_update(show_msg)
+    
+    def on_update_available(self, latest_version, show_msg=True):
         self.log(f"发现新版本: {latest_version} (当前版本: {CURRENT_VERSION})")
         
+        # 后台检查对同一版本只弹窗提示一次
+        if not show_msg and latest_version == self._notified_version:
+            return
+        self._notified_version = latest_version
+        
         reply = QMessageBox.question(
             self, "发现新版本",
             f"检测到新版本 {latest_version}，当前版本为 {CURRENT_VERSION}。\n是否前往下载页面？",
             QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
         )
         if reply == QMessageBox.Yes:
-            QDesktopServices.openUrl(QUrl("https://github.com/QsSama-W/aliddns/releases"))
+            QDesktopServices.openUrl(self._RELEASES_PAGE)
     
     def on_no_update(self, show_msg):
         """没有更新时只在日志中显示，不弹窗"""
@@ -1253,6 +1661,10 @@ class DNSManagerUI(QMainWindow):
     
     def on_update_check_failed(self, error_msg):
         self.log(f"检查更新失败: {error_msg}", False)
+        # 失败后按指数退避重试，最长不超过常规检查间隔
+        self._update_failures += 1
+        delay = min(UPDATE_RETRY_BASE * 2 ** (self._update_failures - 1), UPDATE_CACHE_TTL)
+        self._update_timer.start(delay * 1000)
 
 
 if __name__ == "__main__":
@@ -1262,4 +1674,8 @@ if __name__ == "__main__":
     
     window = DNSManagerUI()
     window.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    if not window.wait_for_background_tasks():
+        # 仍有请求未结束(如网络卡住的检查更新)，跳过解释器清理直接退出，避免后台线程访问已销毁的对象
+        os._exit(exit_code)
+    sys.exit(exit_code)